@@ -10,30 +10,24 @@
 
 import os
 import sys
+import re
 import json
 import random
 import time
-import threading
-import multiprocessing
-import concurrent.futures
-import hashlib
-import uuid
+import contextlib
 import logging
+import logging.handlers
 import gzip
-import zipfile
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Union, Any, Callable, Tuple, Set
-from dataclasses import dataclass, field
-from pathlib import Path
-from urllib.parse import urlparse, quote, unquote
-import base64
+import shutil
 import secrets
-import sqlite3
+import itertools
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
 import platform
-import psutil
 from lxml import etree
-from xml.dom import minidom
-import xml.etree.ElementTree as ET
+from xml.sax import saxutils
 
 # 🎯 HDGRACE 7170+ 기능 완전 통합 BAS 29.3.1 XML 시스템 - 상업 배포용
 FEATURE_COUNT = 7170  # 업그레이드된 기능 수 (제목 요구사항에 맞춤)
@@ -42,13 +36,465 @@ ACTIONS_PER_FEATURE = 25  # 기능당 평균 액션 수
 BAS_VERSION = "29.3.1"  # BAS 29.3.1 버전
 STRUCTURE_VERSION = "3.1"  # 구조 버전
 BUFFER_SIZE = 1024 * 1024 * 1024  # 1GB 버퍼 (대용량 처리)
+WRITE_BUFFER_SIZE = 1024 * 1024  # 1MB 파일 출력 버퍼 (C 레벨 BufferedWriter)
+IS_WINDOWS = platform.system() == "Windows"  # 실행 플랫폼 (모듈 로드 시 1회 판별)
+TEMP_FILE_SUFFIX = ".tmp"  # 원자적 저장용 임시 파일 접미사 (앞에 실행별 난수 토큰)
+GZIP_COMPRESS_LEVEL = 1  # gzip 압축 레벨 (반복 속성 위주 XML은 1로도 충분한 압축률)
 TIMING_REPORT_ENABLED = True  # 실시간 타이밍 리포트
+LOG_BUFFER_CAPACITY = 1024  # 로그 메모리 버퍼 용량 (레코드 수)
+MACRO_SHARD_SIZE = 500  # 매크로 샤드 크기 (기능 수 - 샤드 단위로 직렬화 후 기록)
+VALIDATION_HEAD_SIZE = 16 * 1024  # 헤더 검증용 선두 읽기 크기
+VALIDATION_HEADER_RE = re.compile(
+    rb'<BrowserAutomationStudioProject>.*?'
+    rb'<EngineVersion>' + re.escape(BAS_VERSION.encode()) + rb'</EngineVersion>.*?'
+    rb'<StructureVersion>' + re.escape(STRUCTURE_VERSION.encode()) + rb'</StructureVersion>',
+    re.DOTALL
+)
+SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_가-힣]')  # 이름 정리용 허용 외 문자 패턴
 
 # 🏢 HDGRACE 프로덕션 설정 (상업 배포용)
 OUTPUT_DIR = os.path.join(os.getcwd(), "output")
 WINDOWS_OUTPUT_DIR = "C:/Users/office2/Pictures/Desktop/3065"  # Windows 호환성
 LOG_DIR = os.path.join(OUTPUT_DIR, "logs")
 
+# 🎯 기능 카테고리별 분류 (7170개 총합)
+FEATURE_CATEGORIES = {
+    # YouTube 자동화 기능들 (1200개)
+    "YouTube_자동화": {
+        "count": 1200,
+        "base_features": [
+            "고정_시청자_50000명_유지", "조회수_반복_입장_이탈", "라이브_방송_자동_시청",
+            "동시시청자_유지", "조회수_시청자_동시_증가", "라이브_스트림_조회수_증가",
+            "LIVE_고정_시청자_유지", "Shorts_시청_최적화", "댓글_좋아요_구독_자동화",
+            "키워드_1등_만들기", "라이브_스트리밍_품질_최적화", "시청자_행동_분석_엔진",
+            "자동_댓글_생성_관리", "라이브_방송_상호작용_자동화", "시청자_피드백_수집",
+            "영상_품질_분석", "키워드_분석_추천", "시청자_라이프사이클_관리",
+            "라이브_스트리밍_성능_모니터링", "시청자_참여도_분석", "채널_성장_자동화",
+            "구독자_증가_시스템", "영상_업로드_자동화", "썸네일_최적화", "제목_SEO_최적화"
+        ]
+    },
+    
+    # 프록시 및 네트워크 관리 (1000개)
+    "프록시_네트워크_관리": {
+        "count": 1000,
+        "base_features": [
+            "글로벌_프록시_자동_전환", "고정_프록시_enterprise_등급", "IMEI_회전_프록시_설정",
+            "회전_프록시_관리", "고정_프록시_사용", "세션_중_IP_변경_금지", "IP_연결_상태_확인",
+            "ISP별_프록시_할당", "아시아_12개국_프록시_선택", "residential_프록시_premium",
+            "datacenter_프록시_고속", "mobile_프록시_authentic", "전용_프록시_enterprise",
+            "프록시_연결_상태_확인", "프록시_풀_새로고침", "CIDR_필터링", "프록시_품질_테스트",
+            "프록시_품질_실시간_모니터링", "프록시_로테이션_최적화", "프록시_연결_상태_분석",
+            "프록시_자동_테스트", "프록시_성능_최적화", "프록시_품질_모니터링", "지역별_프록시_분산"
+        ]
+    },
+    
+    # 보안 및 탐지 회피 (900개)
+    "보안_탐지회피": {
+        "count": 900,
+        "base_features": [
+            "enterprise_탐지_방지_모드", "AI_블랙리스트_회피", "보안_상태_실시간_모니터링", 
+            "advanced_AI_보호_모드", "지문_무작위화_premium", "터치_이벤트_조작", "타임존_조작",
+            "랜덤_해상도_User_Agent", "캡차_감지_해결_자동화", "계정_생성_enterprise",
+            "보안_설정_자동화", "복구_이메일_전화번호_설정", "프로필_이미지_채널명_설정",
+            "계정_정보_파싱_검증", "계정_상태_실시간_모니터링", "SMS_인증_자동화_premium",
+            "fingerprint_spoofing", "canvas_fingerprint_protection", "webgl_fingerprint_masking",
+            "audio_fingerprint_randomization", "screen_resolution_spoofing", "timezone_randomization",
+            "language_preference_masking", "plugin_detection_evasion", "font_fingerprint_protection"
+        ]
+    },
+    
+    # UI 및 사용자 인터페이스 (800개)
+    "UI_사용자인터페이스": {
+        "count": 800,
+        "base_features": [
+            "enterprise_dashboard_시스템", "실시간_모니터링_UI", "다국어_지원_시스템",
+            "반응형_웹_디자인", "모바일_최적화_UI", "접근성_강화_인터페이스",
+            "커스텀_브랜딩_시스템", "테마_커스터마이징", "단축키_매핑_시스템",
+            "드래그_앤_드롭_인터페이스", "실시간_알림_시스템", "진행_상황_추적_UI",
+            "데이터_시각화_차트", "성능_메트릭_대시보드", "사용자_권한_관리_UI",
+            "설정_백업_복원_UI", "로그_뷰어_인터페이스", "에러_보고_시스템_UI",
+            "자동_업데이트_알림_UI", "라이센스_관리_인터페이스", "API_키_관리_UI",
+            "프록시_선택_UI_버튼", "국가별_이모지_버튼", "실시간_상태_표시기"
+        ]
+    },
+    
+    # 시스템 관리 및 모니터링 (700개)
+    "시스템_관리모니터링": {
+        "count": 700,
+        "base_features": [
+            "enterprise_예외_처리_설정", "자동_재시작_시스템", "오류_복구_자동화",
+            "시스템_크래시_자동_복구", "작업_일시정지_재개", "스케줄된_작업_실행",
+            "실행_흐름_제어", "마스터_실행_컨트롤러", "데이터베이스_통합_관리",
+            "Excel_데이터_가져오기", "품질_보증_QA_자동화", "최종_통합_테스트",
+            "고급_보고_시스템", "실시간_분석_차트", "성과_보고서_생성",
+            "데이터_시각화_엔진", "성능_모니터링_시스템", "리소스_사용량_추적",
+            "메모리_누수_감지", "CPU_사용률_최적화", "디스크_공간_관리",
+            "네트워크_대역폭_모니터링", "백업_시스템_자동화", "재해_복구_시스템"
+        ]
+    },
+    
+    # AI 및 머신러닝 (650개)
+    "AI_머신러닝": {
+        "count": 650,
+        "base_features": [
+            "AI_행동_패턴_분석", "머신러닝_최적화_엔진", "딥러닝_콘텐츠_생성",
+            "자연어_처리_시스템", "컴퓨터_비전_분석", "예측_모델링_시스템",
+            "이상_탐지_알고리즘", "추천_엔진_시스템", "감정_분석_도구",
+            "텍스트_생성_AI", "이미지_인식_시스템", "음성_인식_변환",
+            "자동_번역_시스템", "키워드_분석_AI", "트렌드_예측_모델",
+            "사용자_행동_예측", "콘텐츠_최적화_AI", "개인화_추천_시스템",
+            "실시간_학습_알고리즘", "강화_학습_시스템", "신경망_최적화"
+        ]
+    },
+    
+    # 고급 자동화 알고리즘 (620개)
+    "고급_자동화알고리즘": {
+        "count": 620,
+        "base_features": [
+            "enterprise_영상_반복_재생_알고리즘", "키워드_기반_검색_유입_시청",
+            "키워드_순위_개선_시스템", "쇼츠_재생_최적화", "자동_시청자_유지_시스템",
+            "라이브_스트리밍_자동화", "자동_라이브_방송_시작", "라이브_방송_성과_분석",
+            "시청자_이탈_원인_분석", "쇼츠_품질_분석", "자동_시청자_확보",
+            "라이브_스트리밍_리소스_최적화", "시청자_행동_예측_모델", "자동_시청자_확장",
+            "라이브_방송_자동화_프로세스", "시청자_리텐션_예측", "자동_시청자_관리",
+            "라이브_스트리밍_자동화_엔진", "시청자_참여도_예측", "쇼츠_자동_분석",
+            "자동_시청자_유지_시스템", "라이브_방송_품질_최적화", "시청자_행동_분석_엔진"
+        ]
+    },
+    
+    # 통합 및 API 관리 (600개)
+    "통합_API관리": {
+        "count": 600,
+        "base_features": [
+            "REST_API_통합_관리", "GraphQL_API_지원", "웹훅_자동화_시스템",
+            "클라우드_통합_플랫폼", "데이터베이스_연합_시스템", "메시지_큐_관리",
+            "이벤트_스트리밍_시스템", "마이크로서비스_아키텍처", "컨테이너화_지원",
+            "서비스_메시_관리", "API_게이트웨이_시스템", "인증_권한_부여_시스tem",
+            "로드_밸런싱_시스템", "캐싱_최적화_시스템", "CDN_통합_관리",
+            "실시간_동기화_시스템", "데이터_변환_파이프라인", "ETL_프로세스_자동화",
+            "스키마_검증_시스템", "API_버전_관리", "SDK_생성_도구"
+        ]
+    },
+    
+    # 엔터프라이즈 비즈니스 기능 (600개)
+    "엔터프라이즈_비즈니스": {
+        "count": 600,
+        "base_features": [
+            "멀티_테넌시_관리", "화이트_라벨링_시스템", "빌링_자동화_시스템",
+            "구독_관리_시스템", "고객_지원_시스템", "영업_자동화_도구",
+            "마케팅_자동화_플랫폼", "CRM_통합_시스템", "ERP_연동_시스템",
+            "회계_시스템_통합", "인사_관리_시스템", "프로젝트_관리_도구",
+            "문서_관리_시스템", "지식_베이스_시스템", "티켓팅_시스템",
+            "워크플로우_자동화", "승인_프로세스_관리", "감사_추적_시스템",
+            "컴플라이언스_모니터링", "위험_관리_시스템", "보고서_자동_생성"
+        ]
+    }
+}
+
+# 🎥 YouTube 액션 (100개)
+YOUTUBE_ACTIONS = (
+    "VideoPlay", "VideoUpload", "VideoDownload", "VideoEdit", "VideoShare",
+    "VideoLike", "VideoComment", "LiveStream", "ChannelManage", "PlaylistCreate",
+    "CommentPost", "SearchVideo", "TrendingView", "AnalyticsView", "SubscriberManage",
+    "ViewerEngage", "StreamOptimize", "QualityEnhance", "ChatModerate", "SuperChatManage",
+    "MembershipControl", "PremierSchedule", "ThumbnailOptimize", "DescriptionUpdate", "TagsOptimize"
+)
+
+# 🌐 브라우저 액션 (100개)
+BROWSER_ACTIONS = (
+    "PageNavigate", "PageReload", "ElementClick", "ElementInput", "FormSubmit",
+    "TabManage", "WindowControl", "CookieManage", "StorageControl", "ScreenshotTake",
+    "DataExtract", "SessionManage", "BookmarkManage", "HistoryManage", "DownloadManage"
+)
+
+# 📊 시스템 액션 (100개)
+SYSTEM_ACTIONS = (
+    "ProcessMonitor", "ServiceControl", "FileOperation", "RegistryEdit", "NetworkConfig",
+    "SecurityScan", "PerformanceOptimize", "ErrorHandle", "LogManage", "BackupRestore"
+)
+ACTION_VERSION_SUFFIXES = tuple(f"_V{version}" for version in range(1, 11))  # 액션 버전 접미사
+
+# 🧩 BAS 모듈 구성 (모든 모듈이 공유하는 속성은 공통 템플릿으로 유지)
+MODULE_NAMES = (
+    # 필수 26개 블록/모듈
+    "Dat", "Updater", "DependencyLoader", "CompatibilityLayer", "Dash", "Script",
+    "Resource", "Module", "Navigator", "Security", "Network", "Storage",
+    "Scheduler", "UIComponents", "Macro", "Action", "Function", "LuxuryUI",
+    "Theme", "Logging", "Metadata", "CpuMonitor", "ThreadMonitor", "MemoryGuard",
+    "LogError", "RetryAction",
+    
+    # 추가 엔터프라이즈 모듈
+    "AI", "MachineLearning", "DeepLearning", "NaturalLanguage", "ComputerVision", "Analytics",
+    "BusinessIntelligence", "Automation", "Integration", "API", "Webhook", "Cloud",
+    "Database", "Cache", "Queue", "Messaging", "Notification", "Monitoring",
+    "Alerting", "Reporting", "Backup", "Recovery", "Compliance", "Audit",
+    "Encryption"
+)
+MODULE_BASE_ATTRS = {"version": "3.1", "enabled": "true", "visible": "true"}  # 모듈 공통 속성
+
+# 📁 BAS 리소스 (이름, 경로) - 모듈 로드 시 1회 계산
+RESOURCES = tuple(
+    (resource.split("/")[-1].split(".")[0], resource)
+    for resource in (
+        "proxies.txt", "smsapikeys.txt", "recaptchaapikey.txt", "accounts.txt",
+        "avatars/", "scraped_videos.txt", "2fa_keys.txt", "target_channels.txt",
+        "proxies/korea_proxies.txt", "proxies/japan_proxies.txt", "proxies/us_proxies.txt",
+        "keywords/video_keywords.txt", "keywords/live_keywords.txt", "keywords/shorts_keywords.txt",
+        "comments.txt", "messages.txt", "config.json"
+    )
+)
+
+# 📦 BAS 모듈 메타데이터 (ModulesMetaJson)
+MODULE_METADATA = {
+    "Browser": True,
+    "HTTP": True,
+    "Files": True,
+    "Proxy": True,
+    "GlobalStorage": True,
+    "GZip": True,
+    "XPath": True,
+    "JavaScriptES6": True,
+    "RegExp": True,
+    "Loops": True,
+    "Logic": True,
+    "Math": True,
+    "Notifications": True,
+    "Utils": True,
+    "System": True,
+    "ChromePlugin": True,
+    "DateTime": True,
+    "Variables": True,
+    "Graphic": True,
+    "Lists": True,
+    "Cookies": True,
+    "TextProcessing": True,
+    "Sound": True,
+    "Input": True,
+    "YandexDisk": True,
+    "NativeMessaging": True,
+    "GoogleDrive": True,
+    "Dropbox": True,
+    "IMAP": True,
+    "Selenium": True,
+    "Templates": True,
+    "SSH": True,
+    "FTP": True,
+    "Excel": True,
+    "SQL": True,
+    "ReCaptcha": True,
+    "FunCaptcha": True,
+    "HCaptcha": True,
+    "SmsReceive": True,
+    "Checksum": True,
+    "MailDeprecated": True
+}
+MODULE_METADATA_JSON = json.dumps(MODULE_METADATA, separators=(",", ":"))  # 압축 JSON (1회 직렬화)
+
+# 📜 BAS 메인 스크립트 (정적 - 실행마다 재생성하지 않음)
+MAIN_SCRIPT = '''
+// HDGRACE Enterprise BAS 29.3.1 Main Script
+// 7170개 기능 완전 통합 상업 배포용 스크립트
+
+function main() {
+    log("🚀 HDGRACE Enterprise System Starting...");
+    
+    // 초기화
+    initializeSystem();
+    
+    // 프록시 설정
+    setupProxyRotation();
+    
+    // YouTube 자동화 시작
+    startYouTubeAutomation();
+    
+    // 모니터링 시작
+    startMonitoring();
+    
+    // 메인 루프
+    mainLoop();
+}
+
+function initializeSystem() {
+    log("🔧 시스템 초기화 중...");
+    
+    // 설정 로드
+    loadConfiguration();
+    
+    // 모듈 초기화
+    initializeModules();
+    
+    // UI 초기화
+    initializeUI();
+    
+    log("✅ 시스템 초기화 완료");
+}
+
+function setupProxyRotation() {
+    log("🌐 프록시 로테이션 설정 중...");
+    
+    // 아시아 12개국 프록시 설정
+    var countries = ["korea", "japan", "philippines", "vietnam", "thailand", 
+                    "singapore", "hongkong", "taiwan", "malaysia", "indonesia", 
+                    "india", "china"];
+    
+    for (var i = 0; i < countries.length; i++) {
+        setupCountryProxy(countries[i]);
+    }
+    
+    log("✅ 프록시 로테이션 설정 완료");
+}
+
+function startYouTubeAutomation() {
+    log("🎥 YouTube 자동화 시작...");
+    
+    // 고정 시청자 시스템
+    startFixedViewerSystem();
+    
+    // 라이브 스트림 모니터링
+    startLiveStreamMonitoring();
+    
+    // 쇼츠 자동화
+    startShortsAutomation();
+    
+    log("✅ YouTube 자동화 시작 완료");
+}
+
+function startMonitoring() {
+    log("📊 모니터링 시스템 시작...");
+    
+    // 성능 모니터링
+    startPerformanceMonitoring();
+    
+    // 보안 모니터링
+    startSecurityMonitoring();
+    
+    // 에러 모니터링
+    startErrorMonitoring();
+    
+    log("✅ 모니터링 시스템 시작 완료");
+}
+
+function mainLoop() {
+    log("🔄 메인 루프 시작...");
+    
+    while (true) {
+        try {
+            // 상태 확인
+            checkSystemStatus();
+            
+            // 작업 실행
+            executeScheduledTasks();
+            
+            // 리소스 정리
+            cleanupResources();
+            
+            // 대기
+            sleep(1000);
+            
+        } catch (error) {
+            log("❌ 메인 루프 오류: " + error.message);
+            handleError(error);
+        }
+    }
+}
+
+// 실행
+main();
+'''
+
+def _cdata_element_bytes(tag: str, text: str) -> bytes:
+    """CDATA 단일 요소를 UTF-8 바이트로 사전 직렬화 (정적 본문 - 기록 시 인코딩 생략)"""
+    # etree.CDATA와 동일하게 CDATA 종료 구분자 포함 본문 거부 (잘못된 XML 출력 방지)
+    if "]]>" in text:
+        raise ValueError(f"'{tag}' CDATA 본문에 ']]>'를 포함할 수 없습니다")
+    return f"<{tag}><![CDATA[{text}]]></{tag}>\n".encode("utf-8")
+
+# 📦 정적 CDATA 요소 (모듈 로드 시 1회 인코딩, 출력 스트림에 그대로 기록)
+MAIN_SCRIPT_ELEMENT_BYTES = _cdata_element_bytes("Script", MAIN_SCRIPT)
+MODULE_METADATA_ELEMENT_BYTES = _cdata_element_bytes("ModulesMetaJson", MODULE_METADATA_JSON)
+EMBEDDED_DATA_ELEMENT_BYTES = _cdata_element_bytes("EmbeddedData", "[]")
+
+def _escape_attr_bytes(value: str) -> bytes:
+    """속성 값 XML 이스케이프 후 UTF-8 인코딩"""
+    return saxutils.escape(value, {'"': "&quot;"}).encode("utf-8")
+
+# ⚡ 매크로 직렬화 바이트 템플릿 (액션 단위 요소 생성 없이 UTF-8 바이트 직접 출력)
+MACRO_TEMPLATES = {
+    # 들여쓰기 출력 (pretty_print_xml=True): (매크로 시작, 액션, 매크로 종료)
+    True: (
+        b'<Macro Name="%s" Visible="%s" Enabled="%s">\n  <Description>%s</Description>\n  <Actions>\n',
+        b'    <Action Type="%s" Enabled="true" Visible="true">\n'
+        b'      <Parameters>\n'
+        b'        <Timeout>%d</Timeout>\n'
+        b'        <RetryCount>%d</RetryCount>\n'
+        b'      </Parameters>\n'
+        b'    </Action>\n',
+        b'  </Actions>\n</Macro>\n'
+    ),
+    # 압축 출력 (기본값): 매크로당 한 줄
+    False: (
+        b'<Macro Name="%s" Visible="%s" Enabled="%s"><Description>%s</Description><Actions>',
+        b'<Action Type="%s" Enabled="true" Visible="true">'
+        b'<Parameters><Timeout>%d</Timeout><RetryCount>%d</RetryCount></Parameters></Action>',
+        b'</Actions></Macro>\n'
+    )
+}
+
+def _build_text_elements(items: Tuple[Tuple[str, str], ...]) -> Tuple:
+    """정적 텍스트 요소 생성 (모듈 로드 시 1회)"""
+    elements = []
+    for tag, text in items:
+        elem = etree.Element(tag)
+        elem.text = text
+        elem.tail = "\n"
+        elements.append(elem)
+    return tuple(elements)
+
+# 📋 프로젝트 정적 메타데이터 요소 (실행마다 변하지 않는 값만 사전 생성)
+PROJECT_HEADER_ELEMENTS = _build_text_elements((
+    ("EngineVersion", BAS_VERSION),
+    ("StructureVersion", STRUCTURE_VERSION),
+    ("ProjectName", "HDGRACE-BAS-Final-Enterprise"),
+    ("ProjectVersion", "3.0.0-ENTERPRISE")
+))
+PROJECT_INFO_ELEMENTS = _build_text_elements((
+    ("Author", "HDGRACE Enterprise System"),
+    ("Description", "7170개 기능 완전 통합 상업 배포용 BAS 29.3.1 프로젝트")
+))
+DATABASE_SETTINGS_ELEMENTS = _build_text_elements((
+    ("Schema", ""),
+    ("ConnectionIsRemote", "true"),
+    ("HideDatabase", "true"),
+    ("DatabaseAdvanced", "true")
+))
+SECURITY_SETTINGS_ELEMENTS = _build_text_elements((
+    ("ProtectionStrength", "4"),
+    ("ScriptName", "HDGRACEEnterprise")
+))
+
+# 📤 출력 설정 (정적 값 - 모듈 로드 시 1회 직렬화, 출력 스트림에 그대로 기록)
+OUTPUT_SETTINGS_XML = "".join(
+    f'<OutputTitle{i} en="Results {i}" ru="Results {i}" ko="결과 {i}"/>\n'
+    f'<OutputVisible{i}>{"1" if i <= 3 else "0"}</OutputVisible{i}>\n'
+    for i in range(1, 10)
+)
+OUTPUT_SETTINGS_BYTES = OUTPUT_SETTINGS_XML.encode("utf-8")
+
+class HDGRACEFeature(NamedTuple):
+    """🎯 HDGRACE 기능 레코드 (기능당 dict 대신 경량 튜플)"""
+    index: int
+    name: str
+    category: str
+    safe_name: str
+    visible: str
+    enabled: str
+    priority: str
+    
+    @property
+    def description(self) -> str:
+        """기능 설명 (기록 시점에 생성 - 기능별 문자열을 미리 보관하지 않음)"""
+        return f"{self.name} 완전 구현 (BAS 29.3.1 기반)"
+
 # 🛡️ 보안 예외 클래스
 class SecurityError(Exception):
     """보안 관련 예외"""
@@ -85,14 +531,75 @@ class HDGRACEEnterpriseConfig:
         "automated_scaling": True,
         "disaster_recovery": True
     })
+    pretty_print_xml: bool = False  # 들여쓰기 출력 (개발용 - 상업 배포 기본값은 압축 출력)
+    gzip_output: bool = False  # 평문 XML과 함께 .xml.gz 동시 출력 (생성 중 스트리밍 압축)
+    validate_output: bool = False  # 생성 후 전체 구조 재파싱 검증 (기본은 헤더 검증만 - 요소 단위 생성으로 구조 보장)
+
+def _render_macro_shard(macro_rows: List[Tuple[bytes, bytes, bytes, bytes]], action_types: List[bytes],
+                        seed: int, pretty_print: bool) -> bytes:
+    """매크로 샤드 직렬화 (교정/이스케이프 완료된 바이트만 전달받음)"""
+    rng = random.Random(seed)
+    macro_open_template, action_template, macro_close = MACRO_TEMPLATES[pretty_print]
+    
+    # 난수 일괄 생성 (종류별 1회 호출 - 액션마다 randint/choice 호출 제거)
+    action_counts = rng.choices(range(20, 31), k=len(macro_rows))
+    total_actions = sum(action_counts)
+    action_draws = zip(
+        rng.choices(action_types, k=total_actions),
+        rng.choices(range(1000, 5001), k=total_actions),
+        rng.choices(range(1, 4), k=total_actions)
+    )
+    
+    fragments = []
+    for macro_row, action_count in zip(macro_rows, action_counts):
+        # 매크로 시작 태그 + 설명
+        fragments.append(macro_open_template % macro_row)
+        
+        # 액션들 추가 (기능당 랜덤 25개 액션)
+        for action_draw in itertools.islice(action_draws, action_count):
+            fragments.append(action_template % action_draw)
+        
+        fragments.append(macro_close)
+    
+    return b"".join(fragments)
+
+class _TeeWriter:
+    """다중 스트림 동시 기록 (평문 XML + gzip 동시 출력용)"""
+    
+    def __init__(self, *streams):
+        self._streams = streams
+    
+    def write(self, data: bytes) -> int:
+        for stream in self._streams:
+            stream.write(data)
+        return len(data)
+    
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
 
 class HDGRACEXMLGenerator:
     """🚀 HDGRACE BAS 29.3.1 XML 생성기 - 상업 배포용 완전체"""
     
-    def __init__(self, config: Optional[HDGRACEEnterpriseConfig] = None):
+    # 카테고리별 이모지 (호출마다 재생성하지 않도록 클래스 상수로 유지)
+    _EMOJI_MAP = {
+        "YouTube_자동화": "🎥",
+        "프록시_네트워크_관리": "🌐",
+        "보안_탐지회피": "🛡️",
+        "UI_사용자인터페이스": "🎨",
+        "시스템_관리모니터링": "📊",
+        "AI_머신러닝": "🤖",
+        "고급_자동화알고리즘": "⚡",
+        "통합_API관리": "🔗",
+        "엔터프라이즈_비즈니스": "🏢"
+    }
+    
+    def __init__(self, config: Optional[HDGRACEEnterpriseConfig] = None, seed: Optional[int] = None):
         self.config = config or HDGRACEEnterpriseConfig()
+        self._rng = random.Random(seed)  # 인스턴스 전용 난수 생성기 (seed 지정 시 재현 가능 출력)
         self.logger = self._setup_logging()
         self.features = []
+        self.features_by_category = {}
         self.action_types = []
         self.modules = []
         self.ui_components = []
@@ -112,12 +619,11 @@ class HDGRACEXMLGenerator:
     def _setup_environment(self):
         """환경 설정"""
         try:
-            # 출력 디렉토리 생성
-            for directory in [OUTPUT_DIR, LOG_DIR]:
-                os.makedirs(directory, exist_ok=True)
+            # 출력 디렉토리 생성 (LOG_DIR은 OUTPUT_DIR 하위 - 1회 호출로 상위까지 생성)
+            os.makedirs(LOG_DIR, exist_ok=True)
             
             # Windows 호환성
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 try:
                     os.makedirs(WINDOWS_OUTPUT_DIR, exist_ok=True)
                 except Exception as e:
@@ -130,9 +636,14 @@ class HDGRACEXMLGenerator:
             sys.exit(1)
     
     def _setup_logging(self):
-        """로깅 시스템 설정"""
+        """로깅 시스템 설정 (INFO 로그는 메모리 버퍼에 모았다가 일괄 출력)"""
         logger = logging.getLogger("HDGRACEGenerator")
         logger.setLevel(logging.DEBUG)
+        logger.propagate = False  # 루트 로거 중복 출력 방지
+        
+        # 생성기를 여러 번 만들어도 핸들러 중복 등록 방지
+        if logger.handlers:
+            return logger
         
         # 콘솔 핸들러
         console_handler = logging.StreamHandler()
@@ -144,9 +655,19 @@ class HDGRACEXMLGenerator:
         )
         console_handler.setFormatter(formatter)
         
-        logger.addHandler(console_handler)
+        # 메모리 핸들러 (ERROR 이상 또는 용량 도달 시 콘솔로 일괄 출력)
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=console_handler
+        )
+        
+        logger.addHandler(memory_handler)
         return logger
     
+    def _flush_logs(self):
+        """버퍼링된 로그 즉시 출력"""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
     def _load_correction_rules(self):
         """GitHub 교정 규칙 로드 (1,500,000개 기반)"""
         self.corrections = {
@@ -174,698 +695,328 @@ class HDGRACEXMLGenerator:
         """7170개 기능 준비 (제목 요구사항)"""
         self.logger.info("🎯 7170개 기능 준비 시작...")
         
-        # 기능 카테고리별 분류 (7170개 총합)
-        feature_categories = {
-            # YouTube 자동화 기능들 (1200개)
-            "YouTube_자동화": {
-                "count": 1200,
-                "base_features": [
-                    "고정_시청자_50000명_유지", "조회수_반복_입장_이탈", "라이브_방송_자동_시청",
-                    "동시시청자_유지", "조회수_시청자_동시_증가", "라이브_스트림_조회수_증가",
-                    "LIVE_고정_시청자_유지", "Shorts_시청_최적화", "댓글_좋아요_구독_자동화",
-                    "키워드_1등_만들기", "라이브_스트리밍_품질_최적화", "시청자_행동_분석_엔진",
-                    "자동_댓글_생성_관리", "라이브_방송_상호작용_자동화", "시청자_피드백_수집",
-                    "영상_품질_분석", "키워드_분석_추천", "시청자_라이프사이클_관리",
-                    "라이브_스트리밍_성능_모니터링", "시청자_참여도_분석", "채널_성장_자동화",
-                    "구독자_증가_시스템", "영상_업로드_자동화", "썸네일_최적화", "제목_SEO_최적화"
-                ]
-            },
-            
-            # 프록시 및 네트워크 관리 (1000개)
-            "프록시_네트워크_관리": {
-                "count": 1000,
-                "base_features": [
-                    "글로벌_프록시_자동_전환", "고정_프록시_enterprise_등급", "IMEI_회전_프록시_설정",
-                    "회전_프록시_관리", "고정_프록시_사용", "세션_중_IP_변경_금지", "IP_연결_상태_확인",
-                    "ISP별_프록시_할당", "아시아_12개국_프록시_선택", "residential_프록시_premium",
-                    "datacenter_프록시_고속", "mobile_프록시_authentic", "전용_프록시_enterprise",
-                    "프록시_연결_상태_확인", "프록시_풀_새로고침", "CIDR_필터링", "프록시_품질_테스트",
-                    "프록시_품질_실시간_모니터링", "프록시_로테이션_최적화", "프록시_연결_상태_분석",
-                    "프록시_자동_테스트", "프록시_성능_최적화", "프록시_품질_모니터링", "지역별_프록시_분산"
-                ]
-            },
-            
-            # 보안 및 탐지 회피 (900개)
-            "보안_탐지회피": {
-                "count": 900,
-                "base_features": [
-                    "enterprise_탐지_방지_모드", "AI_블랙리스트_회피", "보안_상태_실시간_모니터링", 
-                    "advanced_AI_보호_모드", "지문_무작위화_premium", "터치_이벤트_조작", "타임존_조작",
-                    "랜덤_해상도_User_Agent", "캡차_감지_해결_자동화", "계정_생성_enterprise",
-                    "보안_설정_자동화", "복구_이메일_전화번호_설정", "프로필_이미지_채널명_설정",
-                    "계정_정보_파싱_검증", "계정_상태_실시간_모니터링", "SMS_인증_자동화_premium",
-                    "fingerprint_spoofing", "canvas_fingerprint_protection", "webgl_fingerprint_masking",
-                    "audio_fingerprint_randomization", "screen_resolution_spoofing", "timezone_randomization",
-                    "language_preference_masking", "plugin_detection_evasion", "font_fingerprint_protection"
-                ]
-            },
-            
-            # UI 및 사용자 인터페이스 (800개)
-            "UI_사용자인터페이스": {
-                "count": 800,
-                "base_features": [
-                    "enterprise_dashboard_시스템", "실시간_모니터링_UI", "다국어_지원_시스템",
-                    "반응형_웹_디자인", "모바일_최적화_UI", "접근성_강화_인터페이스",
-                    "커스텀_브랜딩_시스템", "테마_커스터마이징", "단축키_매핑_시스템",
-                    "드래그_앤_드롭_인터페이스", "실시간_알림_시스템", "진행_상황_추적_UI",
-                    "데이터_시각화_차트", "성능_메트릭_대시보드", "사용자_권한_관리_UI",
-                    "설정_백업_복원_UI", "로그_뷰어_인터페이스", "에러_보고_시스템_UI",
-                    "자동_업데이트_알림_UI", "라이센스_관리_인터페이스", "API_키_관리_UI",
-                    "프록시_선택_UI_버튼", "국가별_이모지_버튼", "실시간_상태_표시기"
-                ]
-            },
-            
-            # 시스템 관리 및 모니터링 (700개)
-            "시스템_관리모니터링": {
-                "count": 700,
-                "base_features": [
-                    "enterprise_예외_처리_설정", "자동_재시작_시스템", "오류_복구_자동화",
-                    "시스템_크래시_자동_복구", "작업_일시정지_재개", "스케줄된_작업_실행",
-                    "실행_흐름_제어", "마스터_실행_컨트롤러", "데이터베이스_통합_관리",
-                    "Excel_데이터_가져오기", "품질_보증_QA_자동화", "최종_통합_테스트",
-                    "고급_보고_시스템", "실시간_분석_차트", "성과_보고서_생성",
-                    "데이터_시각화_엔진", "성능_모니터링_시스템", "리소스_사용량_추적",
-                    "메모리_누수_감지", "CPU_사용률_최적화", "디스크_공간_관리",
-                    "네트워크_대역폭_모니터링", "백업_시스템_자동화", "재해_복구_시스템"
-                ]
-            },
-            
-            # AI 및 머신러닝 (650개)
-            "AI_머신러닝": {
-                "count": 650,
-                "base_features": [
-                    "AI_행동_패턴_분석", "머신러닝_최적화_엔진", "딥러닝_콘텐츠_생성",
-                    "자연어_처리_시스템", "컴퓨터_비전_분석", "예측_모델링_시스템",
-                    "이상_탐지_알고리즘", "추천_엔진_시스템", "감정_분석_도구",
-                    "텍스트_생성_AI", "이미지_인식_시스템", "음성_인식_변환",
-                    "자동_번역_시스템", "키워드_분석_AI", "트렌드_예측_모델",
-                    "사용자_행동_예측", "콘텐츠_최적화_AI", "개인화_추천_시스템",
-                    "실시간_학습_알고리즘", "강화_학습_시스템", "신경망_최적화"
-                ]
-            },
-            
-            # 고급 자동화 알고리즘 (620개)
-            "고급_자동화알고리즘": {
-                "count": 620,
-                "base_features": [
-                    "enterprise_영상_반복_재생_알고리즘", "키워드_기반_검색_유입_시청",
-                    "키워드_순위_개선_시스템", "쇼츠_재생_최적화", "자동_시청자_유지_시스템",
-                    "라이브_스트리밍_자동화", "자동_라이브_방송_시작", "라이브_방송_성과_분석",
-                    "시청자_이탈_원인_분석", "쇼츠_품질_분석", "자동_시청자_확보",
-                    "라이브_스트리밍_리소스_최적화", "시청자_행동_예측_모델", "자동_시청자_확장",
-                    "라이브_방송_자동화_프로세스", "시청자_리텐션_예측", "자동_시청자_관리",
-                    "라이브_스트리밍_자동화_엔진", "시청자_참여도_예측", "쇼츠_자동_분석",
-                    "자동_시청자_유지_시스템", "라이브_방송_품질_최적화", "시청자_행동_분석_엔진"
-                ]
-            },
-            
-            # 통합 및 API 관리 (600개)
-            "통합_API관리": {
-                "count": 600,
-                "base_features": [
-                    "REST_API_통합_관리", "GraphQL_API_지원", "웹훅_자동화_시스템",
-                    "클라우드_통합_플랫폼", "데이터베이스_연합_시스템", "메시지_큐_관리",
-                    "이벤트_스트리밍_시스템", "마이크로서비스_아키텍처", "컨테이너화_지원",
-                    "서비스_메시_관리", "API_게이트웨이_시스템", "인증_권한_부여_시스tem",
-                    "로드_밸런싱_시스템", "캐싱_최적화_시스템", "CDN_통합_관리",
-                    "실시간_동기화_시스템", "데이터_변환_파이프라인", "ETL_프로세스_자동화",
-                    "스키마_검증_시스템", "API_버전_관리", "SDK_생성_도구"
-                ]
-            },
-            
-            # 엔터프라이즈 비즈니스 기능 (600개)
-            "엔터프라이즈_비즈니스": {
-                "count": 600,
-                "base_features": [
-                    "멀티_테넌시_관리", "화이트_라벨링_시스템", "빌링_자동화_시스템",
-                    "구독_관리_시스템", "고객_지원_시스템", "영업_자동화_도구",
-                    "마케팅_자동화_플랫폼", "CRM_통합_시스템", "ERP_연동_시스템",
-                    "회계_시스템_통합", "인사_관리_시스템", "프로젝트_관리_도구",
-                    "문서_관리_시스템", "지식_베이스_시스템", "티켓팅_시스템",
-                    "워크플로우_자동화", "승인_프로세스_관리", "감사_추적_시스템",
-                    "컴플라이언스_모니터링", "위험_관리_시스템", "보고서_자동_생성"
-                ]
-            }
-        }
-        
-        self.features = []
+        self.features: List[HDGRACEFeature] = []
+        self.features_by_category: Dict[str, List[HDGRACEFeature]] = {}  # 카테고리별 기능 인덱스
         feature_index = 0
         
-        for category, info in feature_categories.items():
+        for category, info in FEATURE_CATEGORIES.items():
             count = info["count"]
             base_features = info["base_features"]
             
-            for i in range(count):
-                feature_index += 1
-                
-                if i < len(base_features):
-                    feature_name = base_features[i]
-                else:
-                    feature_name = f"{category}_기능_{i+1}"
-                
-                self.features.append({
-                    "index": feature_index,
-                    "name": feature_name,
-                    "category": category,
-                    "safe_name": self._sanitize_name(feature_name),
-                    "effect": f"{category} 최적화",
-                    "description": f"{feature_name} 완전 구현 (BAS 29.3.1 기반)",
-                    "visible": "true",
-                    "enabled": "true",
-                    "priority": "high" if i < 50 else "medium" if i < 100 else "normal"
-                })
+            # 기능 이름 목록 사전 계산 (기본 기능 + 자동 번호 기능, 반복당 분기 제거)
+            feature_names = base_features[:count] + [
+                f"{category}_기능_{i+1}" for i in range(len(base_features), count)
+            ]
+            
+            # 우선순위 구간 사전 계산 (앞 50개 high, 다음 50개 medium, 나머지 normal)
+            priorities = (["high"] * 50 + ["medium"] * 50 + ["normal"] * count)[:count]
+            
+            for index, feature_name, priority in zip(
+                itertools.count(feature_index + 1), feature_names, priorities
+            ):
+                self.features.append(HDGRACEFeature(
+                    index=index,
+                    name=feature_name,
+                    category=category,
+                    safe_name=self._sanitize_name(feature_name),
+                    visible="true",
+                    enabled="true",
+                    priority=priority
+                ))
+            self.features_by_category[category] = self.features[feature_index:]
+            feature_index += len(feature_names)
         
         self.logger.info(f"✅ {len(self.features)}개 기능 준비 완료 (목표: {FEATURE_COUNT}개)")
     
     def _prepare_action_types(self):
         """액션 타입 준비"""
-        self.action_types = []
-        
-        # YouTube 액션 (100개)
-        youtube_actions = [
-            "VideoPlay", "VideoUpload", "VideoDownload", "VideoEdit", "VideoShare",
-            "VideoLike", "VideoComment", "LiveStream", "ChannelManage", "PlaylistCreate",
-            "CommentPost", "SearchVideo", "TrendingView", "AnalyticsView", "SubscriberManage",
-            "ViewerEngage", "StreamOptimize", "QualityEnhance", "ChatModerate", "SuperChatManage",
-            "MembershipControl", "PremierSchedule", "ThumbnailOptimize", "DescriptionUpdate", "TagsOptimize"
-        ]
-        
-        # 브라우저 액션 (100개)
-        browser_actions = [
-            "PageNavigate", "PageReload", "ElementClick", "ElementInput", "FormSubmit",
-            "TabManage", "WindowControl", "CookieManage", "StorageControl", "ScreenshotTake",
-            "DataExtract", "SessionManage", "BookmarkManage", "HistoryManage", "DownloadManage"
-        ]
-        
-        # 시스템 액션 (100개)
-        system_actions = [
-            "ProcessMonitor", "ServiceControl", "FileOperation", "RegistryEdit", "NetworkConfig",
-            "SecurityScan", "PerformanceOptimize", "ErrorHandle", "LogManage", "BackupRestore"
-        ]
-        
-        # 액션 확장
-        base_actions = youtube_actions + browser_actions + system_actions
-        
-        for i, action in enumerate(base_actions):
-            for version in range(1, 11):  # 각 액션당 10개 버전
-                self.action_types.append(f"{action}_V{version}")
+        # 액션 확장 (각 액션당 10개 버전)
+        base_actions = YOUTUBE_ACTIONS + BROWSER_ACTIONS + SYSTEM_ACTIONS
+        self.action_types = [action + suffix for action in base_actions for suffix in ACTION_VERSION_SUFFIXES]
         
         self.logger.info(f"✅ {len(self.action_types)}개 액션 타입 준비 완료")
     
     def _prepare_modules(self):
-        """모듈 준비"""
-        self.modules = [
-            # 필수 26개 블록/모듈
-            {"name": "Dat", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Updater", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "DependencyLoader", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "CompatibilityLayer", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Dash", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Script", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Resource", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Module", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Navigator", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Security", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Network", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Storage", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Scheduler", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "UIComponents", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Macro", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Action", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Function", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "LuxuryUI", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Theme", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Logging", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Metadata", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "CpuMonitor", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "ThreadMonitor", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "MemoryGuard", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "LogError", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "RetryAction", "version": "3.1", "enabled": "true", "visible": "true"},
-            
-            # 추가 엔터프라이즈 모듈
-            {"name": "AI", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "MachineLearning", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "DeepLearning", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "NaturalLanguage", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "ComputerVision", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Analytics", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "BusinessIntelligence", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Automation", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Integration", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "API", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Webhook", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Cloud", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Database", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Cache", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Queue", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Messaging", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Notification", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Monitoring", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Alerting", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Reporting", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Backup", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Recovery", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Compliance", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Audit", "version": "3.1", "enabled": "true", "visible": "true"},
-            {"name": "Encryption", "version": "3.1", "enabled": "true", "visible": "true"}
-        ]
+        """모듈 준비 (모듈 이름만 보관, 공통 속성은 MODULE_BASE_ATTRS)"""
+        self.modules = list(MODULE_NAMES)
         
         self.logger.info(f"✅ {len(self.modules)}개 모듈 준비 완료")
     
     def _prepare_ui_components(self):
-        """UI 컴포넌트 준비"""
-        self.ui_components = []
+        """UI 컴포넌트 준비 ((태그, XML 속성 dict) 행 - 기록 시 분기/변환 없음)"""
+        self.ui_components: List[Tuple[str, Dict[str, str]]] = []
         
         # 기능 카테고리별 UI 폴더 및 버튼 생성
-        categories = [
-            "YouTube_자동화", "프록시_네트워크_관리", "보안_탐지회피", 
-            "UI_사용자인터페이스", "시스템_관리모니터링", "AI_머신러닝",
-            "고급_자동화알고리즘", "통합_API관리", "엔터프라이즈_비즈니스"
-        ]
-        
-        for i, category in enumerate(categories):
+        for i, category in enumerate(FEATURE_CATEGORIES):
             # 폴더 생성
-            folder = {
-                "type": "folder",
-                "name": category,
-                "visible": "true",
-                "expanded": "true",
-                "position": {"x": 50 + i * 150, "y": 50}
-            }
-            self.ui_components.append(folder)
+            self.ui_components.append(("Folder", {
+                "Name": category,
+                "Visible": "true",
+                "Expanded": "true",
+                "X": str(50 + i * 150),
+                "Y": "50"
+            }))
             
             # 각 폴더에 버튼 생성 (카테고리별 기능 수에 맞춰)
-            category_features = [f for f in self.features if f["category"] == category]
+            category_features = self.features_by_category.get(category, [])
+            text_prefix = self._get_emoji_for_category(category) + " "  # 카테고리 공통 접두어
             
             for j, feature in enumerate(category_features[:50]):  # 폴더당 최대 50개 버튼 표시
-                button = {
-                    "type": "button",
-                    "name": feature["safe_name"],
-                    "text": self._get_emoji_for_category(category) + " " + feature["name"][:30],
-                    "visible": "true",
-                    "enabled": "true",
-                    "folder": category,
-                    "action": f"execute_{feature['safe_name']}",
-                    "position": {"x": 10, "y": 30 + j * 25},
-                    "tooltip": feature["description"]
-                }
-                self.ui_components.append(button)
+                self.ui_components.append(("Button", {
+                    "Name": feature.safe_name,
+                    "Text": text_prefix + feature.name[:30],
+                    "Visible": "true",
+                    "Enabled": "true",
+                    "Folder": category,
+                    "Action": f"execute_{feature.safe_name}",
+                    "X": "10",
+                    "Y": str(30 + j * 25),
+                    "Tooltip": feature.description
+                }))
         
         self.logger.info(f"✅ {len(self.ui_components)}개 UI 컴포넌트 준비 완료")
     
     def _get_emoji_for_category(self, category: str) -> str:
         """카테고리별 이모지 반환"""
-        emoji_map = {
-            "YouTube_자동화": "🎥",
-            "프록시_네트워크_관리": "🌐",
-            "보안_탐지회피": "🛡️",
-            "UI_사용자인터페이스": "🎨",
-            "시스템_관리모니터링": "📊",
-            "AI_머신러닝": "🤖",
-            "고급_자동화알고리즘": "⚡",
-            "통합_API관리": "🔗",
-            "엔터프라이즈_비즈니스": "🏢"
-        }
-        return emoji_map.get(category, "✨")
+        return self._EMOJI_MAP.get(category, "✨")
     
     def _sanitize_name(self, name: str) -> str:
         """이름 정리 (XML 호환성)"""
-        import re
-        sanitized = re.sub(r'[^a-zA-Z0-9_가-힣]', '_', name)
-        return sanitized[:100]  # 길이 제한
+        return SANITIZE_RE.sub('_', name)[:100]  # 길이 제한
     
     def _apply_corrections(self, text: str) -> str:
-        """교정 규칙 적용 (XML 구조 보호)"""
-        # Only apply corrections to attribute values and content, not tag names
-        import re
-        
-        # Apply corrections only to attribute values (between quotes)
-        def correct_attribute_value(match):
-            value = match.group(1)
-            for wrong, correct in self.corrections.items():
-                value = value.replace(wrong, correct)
-            return f'"{value}"'
-        
-        # Apply corrections to attribute values
-        text = re.sub(r'"([^"]*)"', correct_attribute_value, text)
-        
-        return text
+        """교정 규칙 적용 (속성 값 전체 일치 시에만 치환 - 부분 문자열 오교정 방지)"""
+        return self.corrections.get(text, text)
+    
+    def _correct_attrs(self, attrs: Dict[str, str]) -> Dict[str, str]:
+        """속성 dict 교정 (요소 생성 전 적용 - CDATA/텍스트는 대상 아님)"""
+        corrections = self.corrections
+        return {key: corrections.get(value, value) for key, value in attrs.items()}
+    
+    def _write_element(self, xf, elem):
+        """완성된 요소를 스트림에 기록 (기록 후 참조 해제, 요소당 한 줄)"""
+        if not self.config.pretty_print_xml:
+            elem.tail = "\n"
+        xf.write(elem, pretty_print=self.config.pretty_print_xml)
     
-    def generate_xml(self) -> str:
-        """BAS 29.3.1 XML 생성"""
+    def _write_text_element(self, xf, tag: str, text: str):
+        """텍스트 요소 기록"""
+        elem = etree.Element(tag)
+        elem.text = text
+        self._write_element(xf, elem)
+    
+    def _write_static_elements(self, xf, elements: Tuple):
+        """사전 생성된 정적 요소 기록 (속성 없는 텍스트 요소 - 교정 불필요)"""
+        for elem in elements:
+            xf.write(elem)
+    
+    def generate_xml(self, filepath: str):
+        """BAS 29.3.1 XML 생성 (임시 파일에 기록 후 원자적 교체 - 중단 시 불완전 파일 미노출)"""
         start_time = time.time()
         self.logger.info("�� BAS 29.3.1 XML 생성 시작...")
         
-        # XML 루트 생성
-        root = etree.Element("BrowserAutomationStudioProject")
-        
-        # 기본 정보
-        etree.SubElement(root, "EngineVersion").text = BAS_VERSION
-        etree.SubElement(root, "StructureVersion").text = STRUCTURE_VERSION
-        etree.SubElement(root, "ProjectName").text = "HDGRACE-BAS-Final-Enterprise"
-        etree.SubElement(root, "ProjectVersion").text = "3.0.0-ENTERPRISE"
-        etree.SubElement(root, "CreatedDate").text = datetime.now().isoformat()
-        etree.SubElement(root, "Author").text = "HDGRACE Enterprise System"
-        etree.SubElement(root, "Description").text = "7170개 기능 완전 통합 상업 배포용 BAS 29.3.1 프로젝트"
-        
-        # 설정
-        config_elem = etree.SubElement(root, "Configuration")
-        etree.SubElement(config_elem, "MaxThreads").text = str(self.config.parallel_threads)
-        etree.SubElement(config_elem, "MaxViewers").text = str(self.config.max_concurrent_viewers)
-        etree.SubElement(config_elem, "WindowWidth").text = "1920"
-        etree.SubElement(config_elem, "WindowHeight").text = "1080"
-        etree.SubElement(config_elem, "Headless").text = "false"
-        etree.SubElement(config_elem, "RunAsService").text = "true"
-        etree.SubElement(config_elem, "LogLevel").text = "INFO"
-        etree.SubElement(config_elem, "LogPath").text = "C:/Logs/BAS/"
-        
-        # 스크립트
-        script_elem = etree.SubElement(root, "Script")
-        script_content = self._generate_main_script()
-        script_elem.text = etree.CDATA(script_content)
-        
-        # 모듈 정보
-        modules_elem = etree.SubElement(root, "Modules")
-        for module in self.modules:
-            module_elem = etree.SubElement(modules_elem, "Module")
-            module_elem.set("name", module["name"])
-            module_elem.set("version", module["version"])
-            module_elem.set("enabled", module["enabled"])
-            module_elem.set("visible", module["visible"])
-        
-        # 모듈 메타데이터
-        module_meta_elem = etree.SubElement(root, "ModulesMetaJson")
-        module_meta_content = self._generate_module_metadata()
-        module_meta_elem.text = etree.CDATA(module_meta_content)
-        
-        # 리소스
-        resources_elem = etree.SubElement(root, "Resources")
-        self._add_resources(resources_elem)
-        
-        # 매크로
-        macros_elem = etree.SubElement(root, "Macros")
-        self._add_macros(macros_elem)
-        
-        # UI 컴포넌트
-        ui_elem = etree.SubElement(root, "UI")
-        self._add_ui_components(ui_elem)
-        
-        # 출력 설정
-        self._add_output_settings(root)
-        
-        # 임베디드 데이터
-        embedded_elem = etree.SubElement(root, "EmbeddedData")
-        embedded_elem.text = etree.CDATA("[]")
-        
-        # 데이터베이스 설정
-        etree.SubElement(root, "DatabaseId").text = f"Database.{random.randint(10000, 99999)}"
-        etree.SubElement(root, "Schema").text = ""
-        etree.SubElement(root, "ConnectionIsRemote").text = "true"
-        etree.SubElement(root, "HideDatabase").text = "true"
-        etree.SubElement(root, "DatabaseAdvanced").text = "true"
-        
-        # 보안 설정
-        etree.SubElement(root, "ProtectionStrength").text = "4"
-        etree.SubElement(root, "ScriptName").text = "HDGRACEEnterprise"
-        
-        # XML 문자열 생성
-        xml_str = etree.tostring(root, encoding='unicode', pretty_print=True)
-        
-        # 교정 적용
-        xml_str = self._apply_corrections(xml_str)
-        
-        # Clean up the XML string and ensure proper formatting
-        xml_str = xml_str.strip()
-        
-        # 헤더 추가
-        final_xml = f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
+        gzip_path = filepath + ".gz" if self.config.gzip_output else None
+        
+        # 실행별 고유 임시 파일 (최종 경로와 같은 디렉토리 - 동시 실행 간 충돌 방지, 같은 볼륨에서 교체)
+        temp_filepath = temp_gzip_path = None
+        
+        try:
+            temp_filepath = self._make_temp_path(filepath)
+            temp_gzip_path = self._make_temp_path(gzip_path) if gzip_path else None
+            self._write_xml(temp_filepath, temp_gzip_path, os.path.basename(gzip_path) if gzip_path else None)
+            
+            # 유효성 검사 (최종 경로로 옮기기 전 - 검증 실패 파일은 최종 이름을 갖지 않음)
+            if not self.validate_xml(temp_filepath):
+                raise HDGRACEValidationError("XML 유효성 검사 실패")
+            
+            # 원자적 교체 (fsync 생략 - OS 쓰기 지연 캐시 활용)
+            # gzip 압축본을 먼저 교체하고, XML 교체 실패 시 새 압축본을 제거해 짝이 어긋나지 않도록 함
+            if temp_gzip_path:
+                os.replace(temp_gzip_path, gzip_path)
+            try:
+                os.replace(temp_filepath, filepath)
+            except OSError:
+                if gzip_path and os.path.exists(gzip_path):
+                    os.remove(gzip_path)
+                raise
+        except BaseException:
+            # 기록/검증/교체 실패 시 남은 임시 파일 정리 (최종 XML 경로는 손대지 않음)
+            for temp_path in (temp_filepath, temp_gzip_path):
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+            raise
         
         generation_time = time.time() - start_time
         self.logger.info(f"✅ XML 생성 완료 - 소요시간: {generation_time:.2f}초")
-        
-        return final_xml
+        if gzip_path:
+            self.logger.info(f"✅ gzip 압축본 저장 완료: {gzip_path}")
+        self._flush_logs()
     
-    def _generate_main_script(self) -> str:
-        """메인 스크립트 생성"""
-        script = '''
-// HDGRACE Enterprise BAS 29.3.1 Main Script
-// 7170개 기능 완전 통합 상업 배포용 스크립트
-
-function main() {
-    log("🚀 HDGRACE Enterprise System Starting...");
-    
-    // 초기화
-    initializeSystem();
-    
-    // 프록시 설정
-    setupProxyRotation();
-    
-    // YouTube 자동화 시작
-    startYouTubeAutomation();
-    
-    // 모니터링 시작
-    startMonitoring();
-    
-    // 메인 루프
-    mainLoop();
-}
-
-function initializeSystem() {
-    log("🔧 시스템 초기화 중...");
-    
-    // 설정 로드
-    loadConfiguration();
-    
-    // 모듈 초기화
-    initializeModules();
+    def _make_temp_path(self, filepath: str) -> str:
+        """최종 경로와 같은 디렉토리에 고유 임시 파일 생성 후 경로 반환 (umask 그대로 적용)"""
+        directory, filename = os.path.split(filepath)
+        temp_path = os.path.join(directory, f".{filename}.{secrets.token_hex(8)}{TEMP_FILE_SUFFIX}")
+        # 배타적 생성 (이미 있으면 FileExistsError - 다른 실행의 임시 파일을 덮어쓰지 않음)
+        open(temp_path, 'xb').close()
+        return temp_path
     
-    // UI 초기화
-    initializeUI();
-    
-    log("✅ 시스템 초기화 완료");
-}
-
-function setupProxyRotation() {
-    log("🌐 프록시 로테이션 설정 중...");
-    
-    // 아시아 12개국 프록시 설정
-    var countries = ["korea", "japan", "philippines", "vietnam", "thailand", 
-                    "singapore", "hongkong", "taiwan", "malaysia", "indonesia", 
-                    "india", "china"];
-    
-    for (var i = 0; i < countries.length; i++) {
-        setupCountryProxy(countries[i]);
-    }
-    
-    log("✅ 프록시 로테이션 설정 완료");
-}
-
-function startYouTubeAutomation() {
-    log("🎥 YouTube 자동화 시작...");
-    
-    // 고정 시청자 시스템
-    startFixedViewerSystem();
-    
-    // 라이브 스트림 모니터링
-    startLiveStreamMonitoring();
-    
-    // 쇼츠 자동화
-    startShortsAutomation();
-    
-    log("✅ YouTube 자동화 시작 완료");
-}
-
-function startMonitoring() {
-    log("📊 모니터링 시스템 시작...");
-    
-    // 성능 모니터링
-    startPerformanceMonitoring();
+    def _write_xml(self, filepath: str, gzip_path: Optional[str], gzip_name: Optional[str] = None):
+        """XML 본문 스트리밍 기록 (요소 단위, gzip 경로 지정 시 동시 압축 기록)
+        
+        gzip_name은 gzip 헤더에 기록할 최종 파일 이름 (임시 파일 이름 노출 방지)
+        """
+        with contextlib.ExitStack() as stack:
+            raw_file = stack.enter_context(open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE))
+            gzip_file = None
+            if gzip_path:
+                # GzipFile은 전달받은 fileobj를 닫지 않으므로 하부 파일도 스택에서 직접 닫음 (역순 종료)
+                gzip_raw_file = stack.enter_context(open(gzip_path, 'wb', buffering=WRITE_BUFFER_SIZE))
+                gzip_file = stack.enter_context(gzip.GzipFile(
+                    filename=gzip_name or os.path.basename(gzip_path), mode='wb',
+                    fileobj=gzip_raw_file, compresslevel=GZIP_COMPRESS_LEVEL
+                ))
+            f = _TeeWriter(raw_file, gzip_file) if gzip_file is not None else raw_file
+            
+            # 헤더 추가
+            f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+            
+            with etree.xmlfile(f, encoding='utf-8', buffered=False) as xf:
+                with xf.element("BrowserAutomationStudioProject"):
+                    xf.write("\n")
+                    
+                    # 기본 정보
+                    self._write_static_elements(xf, PROJECT_HEADER_ELEMENTS)
+                    self._write_text_element(xf, "CreatedDate", datetime.now(timezone.utc).isoformat(timespec="seconds"))
+                    self._write_static_elements(xf, PROJECT_INFO_ELEMENTS)
+                    
+                    # 설정
+                    config_elem = etree.Element("Configuration")
+                    etree.SubElement(config_elem, "MaxThreads").text = str(self.config.parallel_threads)
+                    etree.SubElement(config_elem, "MaxViewers").text = str(self.config.max_concurrent_viewers)
+                    etree.SubElement(config_elem, "WindowWidth").text = "1920"
+                    etree.SubElement(config_elem, "WindowHeight").text = "1080"
+                    etree.SubElement(config_elem, "Headless").text = "false"
+                    etree.SubElement(config_elem, "RunAsService").text = "true"
+                    etree.SubElement(config_elem, "LogLevel").text = "INFO"
+                    etree.SubElement(config_elem, "LogPath").text = "C:/Logs/BAS/"
+                    self._write_element(xf, config_elem)
+                    
+                    # 스크립트
+                    f.write(MAIN_SCRIPT_ELEMENT_BYTES)
+                    
+                    # 모듈 정보
+                    with xf.element("Modules"):
+                        xf.write("\n")
+                        self._add_modules(xf)
+                    xf.write("\n")
+                    
+                    # 모듈 메타데이터
+                    f.write(MODULE_METADATA_ELEMENT_BYTES)
+                    
+                    # 리소스
+                    with xf.element("Resources"):
+                        xf.write("\n")
+                        self._add_resources(xf)
+                    xf.write("\n")
+                    
+                    # 매크로
+                    with xf.element("Macros"):
+                        xf.write("\n")
+                        self._add_macros(f)
+                    xf.write("\n")
+                    
+                    # UI 컴포넌트
+                    with xf.element("UI"):
+                        xf.write("\n")
+                        self._add_ui_components(xf)
+                    xf.write("\n")
+                    
+                    # 출력 설정
+                    self._add_output_settings(f)
+                    
+                    # 임베디드 데이터
+                    f.write(EMBEDDED_DATA_ELEMENT_BYTES)
+                    
+                    # 데이터베이스 설정
+                    self._write_text_element(xf, "DatabaseId", f"Database.{self._rng.randint(10000, 99999)}")
+                    self._write_static_elements(xf, DATABASE_SETTINGS_ELEMENTS)
+                    
+                    # 보안 설정
+                    self._write_static_elements(xf, SECURITY_SETTINGS_ELEMENTS)
     
-    // 보안 모니터링
-    startSecurityMonitoring();
+    def _add_modules(self, xf):
+        """모듈 추가"""
+        for module_name in self.modules:
+            module_attrs = self._correct_attrs({"name": module_name, **MODULE_BASE_ATTRS})
+            self._write_element(xf, etree.Element("Module", module_attrs))
     
-    // 에러 모니터링
-    startErrorMonitoring();
+    def _add_resources(self, xf):
+        """리소스 추가 (사전 계산된 이름/경로 쌍)"""
+        for name, path in RESOURCES:
+            resource_elem = etree.Element("Resource", self._correct_attrs({"Name": name, "Path": path}))
+            self._write_element(xf, resource_elem)
     
-    log("✅ 모니터링 시스템 시작 완료");
-}
-
-function mainLoop() {
-    log("🔄 메인 루프 시작...");
-    
-    while (true) {
-        try {
-            // 상태 확인
-            checkSystemStatus();
-            
-            // 작업 실행
-            executeScheduledTasks();
-            
-            // 리소스 정리
-            cleanupResources();
-            
-            // 대기
-            sleep(1000);
-            
-        } catch (error) {
-            log("❌ 메인 루프 오류: " + error.message);
-            handleError(error);
-        }
-    }
-}
-
-// 실행
-main();
-'''
-        return script
-    
-    def _generate_module_metadata(self) -> str:
-        """모듈 메타데이터 생성"""
-        metadata = {
-            "Browser": True,
-            "HTTP": True,
-            "Files": True,
-            "Proxy": True,
-            "GlobalStorage": True,
-            "GZip": True,
-            "XPath": True,
-            "JavaScriptES6": True,
-            "RegExp": True,
-            "Loops": True,
-            "Logic": True,
-            "Math": True,
-            "Notifications": True,
-            "Utils": True,
-            "System": True,
-            "ChromePlugin": True,
-            "DateTime": True,
-            "Variables": True,
-            "Graphic": True,
-            "Lists": True,
-            "Cookies": True,
-            "TextProcessing": True,
-            "Sound": True,
-            "Input": True,
-            "YandexDisk": True,
-            "NativeMessaging": True,
-            "GoogleDrive": True,
-            "Dropbox": True,
-            "IMAP": True,
-            "Selenium": True,
-            "Templates": True,
-            "SSH": True,
-            "FTP": True,
-            "Excel": True,
-            "SQL": True,
-            "ReCaptcha": True,
-            "FunCaptcha": True,
-            "HCaptcha": True,
-            "SmsReceive": True,
-            "Checksum": True,
-            "MailDeprecated": True
-        }
-        return json.dumps(metadata, indent=2)
-    
-    def _add_resources(self, resources_elem):
-        """리소스 추가"""
-        resources = [
-            "proxies.txt", "smsapikeys.txt", "recaptchaapikey.txt", "accounts.txt",
-            "avatars/", "scraped_videos.txt", "2fa_keys.txt", "target_channels.txt",
-            "proxies/korea_proxies.txt", "proxies/japan_proxies.txt", "proxies/us_proxies.txt",
-            "keywords/video_keywords.txt", "keywords/live_keywords.txt", "keywords/shorts_keywords.txt",
-            "comments.txt", "messages.txt", "config.json"
+    def _add_macros(self, out):
+        """매크로 추가 (ID 구간별 샤드 단위 직렬 처리 - 샤드당 1회 기록)"""
+        # 교정/이스케이프/인코딩은 렌더링 전에 값마다 1회만 적용
+        action_types = [
+            _escape_attr_bytes(self._apply_corrections(action_type)) for action_type in self.action_types
+        ]
+        macro_rows = [
+            (
+                _escape_attr_bytes(self._apply_corrections(feature.safe_name)),
+                _escape_attr_bytes(self._apply_corrections(feature.visible)),
+                _escape_attr_bytes(self._apply_corrections(feature.enabled)),
+                saxutils.escape(feature.description).encode("utf-8")
+            )
+            for feature in self.features
         ]
+        shards = [
+            macro_rows[start:start + MACRO_SHARD_SIZE]
+            for start in range(0, len(macro_rows), MACRO_SHARD_SIZE)
+        ]
+        # 샤드별 시드는 seed 지정 시 기존과 바이트 단위로 같은 출력을 유지하기 위해 그대로 사용
+        seeds = [self._rng.getrandbits(64) for _ in shards]
+        pretty_print = self.config.pretty_print_xml
+        
+        # 7170개 기능에 대한 매크로 생성 (샤드 순서대로 직렬 기록)
+        for shard, seed in zip(shards, seeds):
+            out.write(_render_macro_shard(shard, action_types, seed, pretty_print))
+    
+    def _add_ui_components(self, xf):
+        """UI 컴포넌트 추가 (사전 계산된 속성 행 기록)"""
+        # 반복문 내 속성 조회 제거 (지역 이름으로 고정)
+        make_element = etree.Element
+        correct_attrs = self._correct_attrs
+        write_element = self._write_element
         
-        for resource in resources:
-            resource_elem = etree.SubElement(resources_elem, "Resource")
-            resource_elem.set("Name", resource.split("/")[-1].split(".")[0])
-            resource_elem.set("Path", resource)
-    
-    def _add_macros(self, macros_elem):
-        """매크로 추가"""
-        # 7170개 기능에 대한 매크로 생성
-        for feature in self.features:
-            macro_elem = etree.SubElement(macros_elem, "Macro")
-            macro_elem.set("Name", feature["safe_name"])
-            macro_elem.set("Visible", feature["visible"])
-            macro_elem.set("Enabled", feature["enabled"])
-            
-            # 매크로 설명
-            desc_elem = etree.SubElement(macro_elem, "Description")
-            desc_elem.text = feature["description"]
-            
-            # 액션들 추가 (기능당 랜덤 25개 액션)
-            actions_elem = etree.SubElement(macro_elem, "Actions")
-            action_count = random.randint(20, 30)
-            
-            for i in range(action_count):
-                action_elem = etree.SubElement(actions_elem, "Action")
-                action_type = random.choice(self.action_types)
-                action_elem.set("Type", action_type)
-                action_elem.set("Enabled", "true")
-                action_elem.set("Visible", "true")
-                
-                # 액션 매개변수
-                params_elem = etree.SubElement(action_elem, "Parameters")
-                etree.SubElement(params_elem, "Timeout").text = str(random.randint(1000, 5000))
-                etree.SubElement(params_elem, "RetryCount").text = str(random.randint(1, 3))
-    
-    def _add_ui_components(self, ui_elem):
-        """UI 컴포넌트 추가"""
         # 모든 UI 컴포넌트에 visible="true" 강제 적용
-        for component in self.ui_components:
-            if component["type"] == "folder":
-                folder_elem = etree.SubElement(ui_elem, "Folder")
-                folder_elem.set("Name", component["name"])
-                folder_elem.set("Visible", component["visible"])
-                folder_elem.set("Expanded", component["expanded"])
-                folder_elem.set("X", str(component["position"]["x"]))
-                folder_elem.set("Y", str(component["position"]["y"]))
-                
-            elif component["type"] == "button":
-                button_elem = etree.SubElement(ui_elem, "Button")
-                button_elem.set("Name", component["name"])
-                button_elem.set("Text", component["text"])
-                button_elem.set("Visible", component["visible"])
-                button_elem.set("Enabled", component["enabled"])
-                button_elem.set("Folder", component["folder"])
-                button_elem.set("Action", component["action"])
-                button_elem.set("X", str(component["position"]["x"]))
-                button_elem.set("Y", str(component["position"]["y"]))
-                button_elem.set("Tooltip", component["tooltip"])
-    
-    def _add_output_settings(self, root):
-        """출력 설정 추가"""
-        for i in range(1, 10):
-            title_elem = etree.SubElement(root, f"OutputTitle{i}")
-            title_elem.set("en", f"Results {i}")
-            title_elem.set("ru", f"Results {i}")
-            title_elem.set("ko", f"결과 {i}")
-            
-            visible_elem = etree.SubElement(root, f"OutputVisible{i}")
-            visible_elem.text = "1" if i <= 3 else "0"
-    
-    def save_xml(self, xml_content: str) -> str:
-        """XML 파일 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        for tag, attrs in self.ui_components:
+            write_element(xf, make_element(tag, correct_attrs(attrs)))
+    
+    def _add_output_settings(self, out):
+        """출력 설정 추가 (사전 직렬화된 바이트 기록)"""
+        out.write(OUTPUT_SETTINGS_BYTES)
+    
+    def save_xml(self, timestamp: Optional[str] = None) -> str:
+        """XML 파일 저장 (스트리밍 생성)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
         filename = f"HDGRACE-BAS-Final-{timestamp}.xml"
         
         # 기본 출력 경로
         filepath = os.path.join(OUTPUT_DIR, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+            self.generate_xml(filepath)
             
             self.logger.info(f"✅ XML 파일 저장 완료: {filepath}")
             
             # Windows 경로에도 저장 시도
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 try:
                     windows_filepath = os.path.join(WINDOWS_OUTPUT_DIR, filename)
-                    with open(windows_filepath, 'w', encoding='utf-8') as f:
-                        f.write(xml_content)
+                    # 독립 사본 (하드 링크와 달리 한쪽 수정이 다른 쪽에 영향 없음 - 커널 고속 경로 복사)
+                    shutil.copyfile(filepath, windows_filepath)
                     self.logger.info(f"✅ Windows 경로 저장 완료: {windows_filepath}")
                 except Exception as e:
                     self.logger.warning(f"⚠️ Windows 경로 저장 실패: {e}")
@@ -876,27 +1027,41 @@ main();
             self.logger.error(f"❌ XML 파일 저장 실패: {e}")
             raise
     
-    def validate_xml(self, xml_content: str) -> bool:
-        """XML 유효성 검사"""
+    def validate_xml(self, filepath: str) -> bool:
+        """XML 유효성 검사 (헤더 정규식 + 선택적 상수 메모리 스트리밍 파싱)"""
         try:
-            # Remove any potential BOM or invalid characters
-            clean_content = xml_content.strip()
-            if clean_content.startswith('\ufeff'):
-                clean_content = clean_content[1:]
+            # 헤더 검증 (선두 블록만 읽기)
+            with open(filepath, 'rb') as f:
+                head = f.read(VALIDATION_HEAD_SIZE)
+            if not VALIDATION_HEADER_RE.search(head):
+                self.logger.error("❌ XML 헤더 검증 실패: EngineVersion/StructureVersion 누락")
+                return False
+            
+            if not self.config.validate_output:
+                self.logger.info("✅ XML 헤더 검증 성공 (전체 구조 검증 생략)")
+                return True
+            
+            # 구조 검증 (처리한 요소는 즉시 해제)
+            for _, elem in etree.iterparse(filepath, events=("end",)):
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
             
-            etree.fromstring(clean_content.encode('utf-8'))
             self.logger.info("✅ XML 스키마 검증 성공")
             return True
         except etree.XMLSyntaxError as e:
             self.logger.error(f"❌ XML 스키마 검증 실패: {e}")
             # Log first few lines for debugging
-            lines = xml_content.split('\n')[:10]
-            for i, line in enumerate(lines, 1):
-                self.logger.error(f"Line {i}: {repr(line)}")
+            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                for i, line in enumerate(f, 1):
+                    if i > 10:
+                        break
+                    self.logger.error(f"Line {i}: {repr(line)}")
             return False
     
-    def generate_statistics_report(self) -> str:
+    def generate_statistics_report(self, generated_at: Optional[datetime] = None) -> str:
         """통계 보고서 생성"""
+        generated_at = generated_at or datetime.now()
         report = f"""
 🏢 HDGRACE Enterprise BAS 29.3.1 생성 보고서
 ========================================
@@ -913,16 +1078,12 @@ main();
 """
         
         # 카테고리별 통계
-        categories = {}
-        for feature in self.features:
-            category = feature["category"]
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
+        categories = Counter(feature.category for feature in self.features)
         
-        for category, count in categories.items():
-            emoji = self._get_emoji_for_category(category)
-            report += f"- {emoji} {category}: {count}개\n"
+        report += "".join(
+            f"- {self._get_emoji_for_category(category)} {category}: {count}개\n"
+            for category, count in categories.items()
+        )
         
         report += f"""
 🛡️ 보안 기능:
@@ -941,7 +1102,7 @@ main();
 - 교정 규칙 {len(self.corrections)}개 적용
 - 상업 배포용 완전체 구현
 
-생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+생성 시간: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}
 """
         return report
     
@@ -950,22 +1111,20 @@ main();
         try:
             self.logger.info("🚀 HDGRACE Enterprise BAS 29.3.1 XML 생성기 실행")
             
-            # XML 생성
-            xml_content = self.generate_xml()
+            # 실행 시각 1회 고정 (XML/보고서 파일명과 보고서 생성 시간 일치)
+            run_started_at = datetime.now()
+            timestamp = run_started_at.strftime("%Y%m%d-%H%M%S")
             
-            # 유효성 검사
-            if not self.validate_xml(xml_content):
-                raise HDGRACEValidationError("XML 유효성 검사 실패")
+            # 통계 보고서 생성 (준비된 데이터만 사용 - XML 기록 전에 미리 완성)
+            report = self.generate_statistics_report(run_started_at)
             
-            # 파일 저장
-            filepath = self.save_xml(xml_content)
+            # XML 생성, 유효성 검사 및 파일 저장 (검증 통과 시에만 최종 경로 저장)
+            filepath = self.save_xml(timestamp)
             
-            # 통계 보고서 생성
-            report = self.generate_statistics_report()
             self.logger.info(f"📊 통계 보고서:\n{report}")
             
-            # 보고서 파일 저장
-            report_filename = f"HDGRACE-Report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt"
+            # 보고서 파일 저장 (검증 통과 시에만)
+            report_filename = f"HDGRACE-Report-{timestamp}.txt"
             report_filepath = os.path.join(OUTPUT_DIR, report_filename)
             
             with open(report_filepath, 'w', encoding='utf-8') as f:
@@ -973,6 +1132,7 @@ main();
             
             self.logger.info(f"✅ 보고서 저장 완료: {report_filepath}")
             self.logger.info(f"🎉 HDGRACE Enterprise BAS 29.3.1 XML 생성 완료!")
+            self._flush_logs()
             
             return filepath
             